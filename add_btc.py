@@ -2,6 +2,8 @@ import pandas as pd
 import yfinance as yf
 from datetime import datetime
 
+from startup_snapshot import build_startup_snapshot
+
 def update_btc_data():
     # Load existing data
     print("Loading existing market data...")
@@ -25,6 +27,7 @@ def update_btc_data():
     
     # Save updated data
     existing_data.to_parquet('market_prices_stooq.parquet', compression='snappy')
+    build_startup_snapshot()
     
     print("\nBTC Data Statistics:")
     print(f"First date: {existing_data['BTC'].first_valid_index().date()}")
@@ -1,54 +1,11 @@
+from __future__ import annotations
+
 import streamlit as st
-import pandas as pd
-import plotly.graph_objects as go
 from datetime import datetime
 
-# ---------------------------- Constants and Configurations ---------------------------- #
+from startup_snapshot import PRICES_PATH, load_startup_snapshot, snapshot_from_prices
 
-ASSET_DESCRIPTIONS = {
-    'SPY': 'S&P 500 ETF',
-    'QQQ': 'Nasdaq 100 ETF',
-    'IWM': 'Russell 2000 ETF',
-    'IJR': 'S&P Small-Cap ETF',
-    'IJH': 'S&P Mid-Cap ETF',
-    'IWF': 'Russell 1000 Growth ETF',
-    'IWD': 'Russell 1000 Value ETF',
-    'EFA': 'Developed Markets ETF',
-    'EWJ': 'Japan ETF',
-    'FXI': 'China ETF',
-    'EWG': 'Germany ETF',
-    'EEM': 'Emerging Markets ETF',
-    'EWZ': 'Brazil ETF',
-    'INDA': 'India ETF',
-    'EWT': 'Taiwan ETF',
-    'EWY': 'South Korea ETF',
-    'EWW': 'Mexico ETF',
-    'TLT': '20+ Year Treasury ETF',
-    'IEF': '7-10 Year Treasury ETF',
-    'LQD': 'Investment Grade Bond ETF',
-    'HYG': 'High Yield Bond ETF',
-    'BND': 'Total Bond Market ETF',
-    'TIP': 'TIPS Bond ETF',
-    'UUP': 'US Dollar ETF',
-    'FXE': 'Euro ETF',
-    'XLF': 'Financial Select Sector SPDR Fund',
-    'XLK': 'Technology Select Sector SPDR Fund',
-    'XLE': 'Energy Select Sector SPDR Fund',
-    'XLV': 'Health Care Select Sector SPDR Fund',
-    'XLI': 'Industrial Select Sector SPDR Fund',
-    'XLP': 'Consumer Staples Select Sector SPDR Fund',
-    'XLY': 'Consumer Discretionary Select Sector SPDR Fund',
-    'XLB': 'Materials Select Sector SPDR Fund',
-    'XLC': 'Communication Services Select Sector SPDR Fund',
-    'XLU': 'Utilities Select Sector SPDR Fund',
-    'VNQ': 'Real Estate ETF',
-    'GLD': 'Gold ETF',
-    'SLV': 'Silver ETF',
-    'USO': 'Oil ETF',
-    'UNG': 'Natural Gas ETF',
-    'DBC': 'Commodity Index ETF',
-    'BTC': 'Bitcoin'
-}
+# ---------------------------- Constants and Configurations ---------------------------- #
 
 TIMEFRAMES = {
     '1M': '1 Month',
@@ -72,8 +29,34 @@ st.set_page_config(
 
 st.markdown("""
     <style>
-    /* Import Google Fonts - Added Playfair Display for WSJ-like style */
-    @import url('https://fonts.googleapis.com/css2?family=Playfair+Display:wght@400;700&family=Roboto:wght@400;700&display=swap');
+    /* Fonts are served from static/fonts so no page load waits on Google Fonts */
+    @font-face {
+        font-family: 'Playfair Display';
+        font-weight: 400;
+        font-display: swap;
+        src: local('Playfair Display'), url('app/static/fonts/PlayfairDisplay-Regular.woff2') format('woff2');
+    }
+
+    @font-face {
+        font-family: 'Playfair Display';
+        font-weight: 700;
+        font-display: swap;
+        src: local('Playfair Display'), url('app/static/fonts/PlayfairDisplay-Bold.woff2') format('woff2');
+    }
+
+    @font-face {
+        font-family: 'Roboto';
+        font-weight: 400;
+        font-display: swap;
+        src: local('Roboto'), local('Roboto-Regular'), url('app/static/fonts/Roboto-Regular.woff2') format('woff2');
+    }
+
+    @font-face {
+        font-family: 'Roboto';
+        font-weight: 700;
+        font-display: swap;
+        src: local('Roboto Bold'), local('Roboto-Bold'), url('app/static/fonts/Roboto-Bold.woff2') format('woff2');
+    }
 
     /* General App Styling */
     .stApp {
@@ -219,18 +202,20 @@ st.markdown("""
 # ---------------------------- Data Loading with Caching ---------------------------- #
 
 @st.cache_data(show_spinner=True, ttl=3600)  # Cached for 1 hour
-def load_data(corr_path: str, prices_path: str):
+def load_prices(prices_path: str, columns: tuple | None = None):
     """
-    Load correlation matrix and market prices data from parquet files.
+    Load market prices from parquet, reading only the requested columns.
+    pandas is imported here so that the header and selectors render before it loads.
     """
+    import pandas as pd
+
     try:
-        corr_matrix = pd.read_parquet(corr_path)
-        prices = pd.read_parquet(prices_path)
+        prices = pd.read_parquet(prices_path, columns=list(columns) if columns else None)
         
         if not isinstance(prices.index, pd.DatetimeIndex):
             prices.index = pd.to_datetime(prices.index)
         
-        return corr_matrix, prices
+        return prices
     except FileNotFoundError as fnf_error:
         st.error(f"File not found: {fnf_error.filename}. Please ensure the data files are present.")
         st.stop()
@@ -241,18 +226,25 @@ def load_data(corr_path: str, prices_path: str):
         st.error(f"An unexpected error occurred while loading data: {e}")
         st.stop()
 
-# ---------------------------- Load Data ---------------------------- #
+@st.cache_data(show_spinner=False, ttl=3600)  # Cached for 1 hour
+def load_snapshot(prices_path: str):
+    """
+    Load the startup metadata (asset list, descriptions, date bounds) from startup_snapshot.json.
+    Falls back to reading the full prices file if the snapshot is missing or stale.
+    """
+    snapshot = load_startup_snapshot(prices_path=prices_path)
+    if snapshot is None:
+        snapshot = snapshot_from_prices(load_prices(prices_path))
+    return snapshot
 
-corr_matrix, prices = load_data('correlation_matrix.parquet', 'market_prices_stooq.parquet')
+# ---------------------------- Load Startup Snapshot ---------------------------- #
 
-# ---------------------------- Header and Asset Setup ---------------------------- #
+snapshot = load_snapshot(PRICES_PATH)
 
-missing_assets = set(prices.columns.unique()) - set(ASSET_DESCRIPTIONS.keys())
-if missing_assets:
-    for asset in missing_assets:
-        ASSET_DESCRIPTIONS[asset] = 'Unknown Asset'
+# ---------------------------- Header and Asset Setup ---------------------------- #
 
-assets = sorted(prices.columns.unique())
+ASSET_DESCRIPTIONS = snapshot['descriptions']
+assets = snapshot['assets']
 asset_options = [f"{asset} ({ASSET_DESCRIPTIONS.get(asset, 'Unknown Asset')})" for asset in assets]
 
 st.markdown("""
@@ -260,17 +252,7 @@ st.markdown("""
     <div class="subheader">Analyze the volatility-adjusted and rolling correlations between various financial assets</div>
     """, unsafe_allow_html=True)
 
-# ---------------------------- Date Range and Asset Selection ---------------------------- #
-
-end_date = prices.index.max()
-start_date = end_date - pd.DateOffset(years=3)
-filtered_prices = prices.loc[start_date:end_date].copy()
-
-expected_trading_days = TRADING_DAYS_PER_YEAR * 3
-actual_trading_days = len(filtered_prices)
-
-if actual_trading_days < expected_trading_days * 0.8:
-    st.warning(f"Insufficient data for a 3-year analysis. Expected at least {int(expected_trading_days * 0.8)} trading days, but found {actual_trading_days} trading days.")
+# ---------------------------- Asset Selection ---------------------------- #
 
 col1, col2 = st.columns(2)
 
@@ -295,6 +277,25 @@ with col2:
 if asset1 == asset2:
     st.warning("Please select two different assets for comparison.")
 
+# ---------------------------- Date Range and Price Loading ---------------------------- #
+
+# Deferred until the selectors are on screen; only the two selected columns are read.
+import pandas as pd
+
+from diversification import basket_report, load_covariance_matrices, rank_diversifiers
+
+prices = load_prices(PRICES_PATH, tuple(dict.fromkeys((asset1, asset2))))
+
+end_date = pd.Timestamp(snapshot['end_date'])
+start_date = end_date - pd.DateOffset(years=3)
+filtered_prices = prices.loc[start_date:end_date].copy()
+
+expected_trading_days = TRADING_DAYS_PER_YEAR * 3
+actual_trading_days = len(filtered_prices)
+
+if actual_trading_days < expected_trading_days * 0.8:
+    st.warning(f"Insufficient data for a 3-year analysis. Expected at least {int(expected_trading_days * 0.8)} trading days, but found {actual_trading_days} trading days.")
+
 # ---------------------------- Correlation Calculation ---------------------------- #
 
 def calculate_volatility_based_correlations(prices_df: pd.DataFrame, asset_a: str, asset_b: str, timeframes: dict):
@@ -352,6 +353,8 @@ rolling_corr_90 = rolling_corr_90.dropna()
 # ---------------------------- Create Plotly Figures ---------------------------- #
 
 def create_price_figure(prices_df: pd.DataFrame, asset1: str, asset2: str, asset_descriptions: dict):
+    import plotly.graph_objects as go
+
     fig = go.Figure()
     
     normalized_prices = prices_df.copy()
@@ -425,6 +428,8 @@ def create_price_figure(prices_df: pd.DataFrame, asset1: str, asset2: str, asset
     return fig
 
 def create_correlation_figure(rolling_corr_30: pd.Series, rolling_corr_90: pd.Series):
+    import plotly.graph_objects as go
+
     fig = go.Figure()
     
     fig.add_trace(
@@ -504,6 +509,74 @@ with col_chart2:
     st.plotly_chart(fig_corr, use_container_width=True, config={'displayModeBar': False})
     st.markdown('</div>', unsafe_allow_html=True)
 
+# ---------------------------- Portfolio Diversification ---------------------------- #
+
+@st.cache_resource(ttl=3600)  # Shared across sessions so the matrices are not copied per rerun
+def load_covariance(cov_path: str):
+    """
+    Load the per-lookback covariance matrices, or None if they have not been computed yet.
+    """
+    try:
+        return load_covariance_matrices(cov_path)
+    except FileNotFoundError:
+        return None
+
+st.markdown('<div class="subheader">Portfolio Diversification</div>', unsafe_allow_html=True)
+
+covariance_matrices = load_covariance('covariance_matrix.parquet')
+
+if covariance_matrices is None:
+    st.info("covariance_matrix.parquet not found. Run calculate_correlations.py to enable diversification queries.")
+else:
+    col_basket, col_settings = st.columns([2, 1])
+
+    with col_basket:
+        held_full = st.multiselect(
+            "Held Assets",
+            options=asset_options,
+            default=[option for option in ['SPY (S&P 500 ETF)', 'TLT (20+ Year Treasury ETF)'] if option in asset_options]
+        )
+        held = [option.split(' (')[0] for option in held_full]
+        weights_df = st.data_editor(
+            pd.DataFrame({'Asset': held, 'Weight': [1.0 / len(held)] * len(held) if held else []}),
+            disabled=['Asset'],
+            hide_index=True,
+            use_container_width=True,
+            key=f"weights_{'_'.join(held)}"
+        )
+
+    with col_settings:
+        lookback = st.selectbox(
+            "Lookback",
+            options=list(covariance_matrices),
+            index=len(covariance_matrices) - 1
+        )
+        rank_by = st.radio("Rank Diversifiers By", options=['Correlation', 'Variance'], horizontal=True)
+        candidate_weight = st.slider("Candidate Weight (%)", min_value=1, max_value=50, value=10) / 100
+
+    if held:
+        holdings = dict(zip(weights_df['Asset'], weights_df['Weight'].fillna(0.0)))
+        try:
+            col_stats, col_ranking = st.columns(2)
+
+            with col_stats:
+                st.markdown("**Basket Statistics**")
+                st.dataframe(basket_report(covariance_matrices, holdings).round(3), use_container_width=True)
+
+            with col_ranking:
+                st.markdown(f"**Top Diversifiers ({lookback})**")
+                diversifiers = rank_diversifiers(
+                    covariance_matrices[lookback],
+                    holdings,
+                    by=rank_by.lower(),
+                    candidate_weight=candidate_weight
+                )
+                st.dataframe(diversifiers.round(3), hide_index=True, use_container_width=True)
+        except ValueError as e:
+            st.warning(str(e))
+    else:
+        st.warning("Select at least one held asset to analyze diversification.")
+
 # ---------------------------- Footer ---------------------------- #
 
 st.markdown(f"""
@@ -0,0 +1,43 @@
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from diversification import basket_report, rank_diversifiers
+
+def synthetic_covariance_matrices(n_assets, n_days=252, seed=0):
+    """
+    One-factor synthetic returns, so the covariance looks like a real asset universe.
+    """
+    rng = np.random.default_rng(seed)
+    market = rng.normal(scale=0.01, size=(n_days, 1))
+    returns = market * rng.uniform(0.2, 1.5, size=n_assets) + rng.normal(scale=0.01, size=(n_days, n_assets))
+    assets = pd.Index([f'A{i}' for i in range(n_assets)])
+    cov_df = pd.DataFrame(np.cov(returns, rowvar=False), index=assets, columns=assets)
+    return {period: cov_df for period in ['1M', '3M', '6M', '12M']}
+
+def time_query(query, runs):
+    query()
+    start = time.perf_counter()
+    for _ in range(runs):
+        query()
+    return (time.perf_counter() - start) / runs
+
+def run_benchmark(n_assets=2000, n_holdings=20, runs=50):
+    print(f"Building a {n_assets}-asset synthetic universe...")
+    covariance_matrices = synthetic_covariance_matrices(n_assets)
+    holdings = {f'A{i}': 1.0 for i in range(0, n_holdings * 10, 10)}
+
+    report_time = time_query(lambda: basket_report(covariance_matrices, holdings), runs)
+    rank_time = time_query(lambda: rank_diversifiers(covariance_matrices['12M'], holdings), runs)
+
+    print(f"Basket report (all lookbacks): {report_time * 1000:.2f} ms")
+    print(f"Rank diversifiers (one lookback): {rank_time * 1000:.2f} ms")
+    return report_time, rank_time
+
+if __name__ == "__main__":
+    try:
+        benchmark_results = run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
+    except Exception as e:
+        print(f"An error occurred: {e}")
@@ -0,0 +1,57 @@
+import statistics
+import subprocess
+import sys
+import time
+
+# Each mode runs in a fresh interpreter so module imports and file reads are measured cold,
+# the way a newly scaled-out dashboard replica sees them.
+STARTUP_MODES = {
+    'eager': """
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+from startup_snapshot import ASSET_DESCRIPTIONS
+corr_matrix = pd.read_parquet('correlation_matrix.parquet')
+prices = pd.read_parquet('market_prices_stooq.parquet')
+assets = sorted(prices.columns.unique())
+asset_options = [f"{asset} ({ASSET_DESCRIPTIONS.get(asset, 'Unknown Asset')})" for asset in assets]
+""",
+    'snapshot': """
+import streamlit as st
+from startup_snapshot import load_startup_snapshot
+snapshot = load_startup_snapshot()
+assert snapshot is not None, 'startup_snapshot.json is missing or stale; run startup_snapshot.py'
+assets = snapshot['assets']
+asset_options = [f"{asset} ({snapshot['descriptions'][asset]})" for asset in assets]
+"""
+}
+
+def time_startup(code, runs):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], check=True)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+def run_benchmark(runs=10):
+    print(f"Measuring time to first render data over {runs} cold starts per mode...")
+
+    # Warm the OS file cache so both modes read from the same state
+    time_startup(STARTUP_MODES['eager'], 1)
+
+    results = {}
+    for mode, code in STARTUP_MODES.items():
+        timings = time_startup(code, runs)
+        results[mode] = statistics.median(timings)
+        print(f"{mode:>9}: median {results[mode] * 1000:.0f} ms, "
+              f"min {min(timings) * 1000:.0f} ms, max {max(timings) * 1000:.0f} ms")
+
+    print(f"\nSpeedup: {results['eager'] / results['snapshot']:.2f}x")
+    return results
+
+if __name__ == "__main__":
+    try:
+        benchmark_results = run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
+    except Exception as e:
+        print(f"An error occurred: {e}")
@@ -1,67 +1,152 @@
 import pandas as pd
 import numpy as np
-from itertools import combinations
 from datetime import datetime
 
-def calculate_all_correlations():
+# Define lookback periods
+LOOKBACKS = {
+    '1M': 21,
+    '3M': 63,
+    '6M': 126,
+    '12M': 252
+}
+
+# Beta is measured against this asset; partial correlations are net of the control set
+BENCHMARK = 'SPY'
+PARTIAL_CONTROLS = ('SPY',)
+
+def accumulate_window_moments(returns: pd.DataFrame, lookbacks: dict):
+    """
+    Accumulate return moments backwards from the latest date in a single pass.
+    The lookback windows all end on the last row, so each longer window only adds the rows
+    the shorter one did not cover. Returns {period: (count, sums, cross_products, complete)},
+    where complete flags assets with a full window of returns.
+    """
+    values = returns.to_numpy(dtype=float)
+    n_rows, n_assets = values.shape
+
+    sums = np.zeros(n_assets)
+    cross_products = np.zeros((n_assets, n_assets))
+    complete = np.ones(n_assets, dtype=bool)
+    covered = 0
+
+    moments = {}
+    for period, days in sorted(lookbacks.items(), key=lambda item: item[1]):
+        block = values[max(n_rows - days, 0):n_rows - covered]
+        covered = min(days, n_rows)
+
+        finite = np.isfinite(block)
+        complete &= finite.all(axis=0)
+        block = np.where(finite, block, 0.0)
+        sums += block.sum(axis=0)
+        cross_products += block.T @ block
+
+        # Like pandas rolling(days), a window longer than the history has no value
+        window_complete = complete & (days <= n_rows)
+        moments[period] = (covered, sums.copy(), cross_products.copy(), window_complete)
+
+    return {period: moments[period] for period in lookbacks}
+
+def moments_to_covariance(count, sums, cross_products, complete):
+    mean = sums / count
+    cov = (cross_products - count * np.outer(mean, mean)) / (count - 1)
+    cov[~complete, :] = np.nan
+    cov[:, ~complete] = np.nan
+    return cov
+
+def covariance_to_correlation(cov):
+    std = np.sqrt(np.diag(cov))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return cov / np.outer(std, std)
+
+def partial_correlation(cov, control_idx):
+    """
+    Correlation of every pair net of the control assets.
+    Conditions on the controls via the Schur complement cov - cov_xz @ inv(cov_zz) @ cov_zx,
+    which matches -P_ij / sqrt(P_ii * P_jj) from the precision matrix of (i, j, controls).
+    """
+    control_cov = cov[np.ix_(control_idx, control_idx)]
+    n_assets = cov.shape[0]
+    if not np.isfinite(control_cov).all():
+        return np.full((n_assets, n_assets), np.nan)
+
+    try:
+        control_precision = np.linalg.inv(control_cov)
+    except np.linalg.LinAlgError:
+        return np.full((n_assets, n_assets), np.nan)
+
+    residual_cov = cov - cov[:, control_idx] @ control_precision @ cov[control_idx, :]
+    partial = covariance_to_correlation(residual_cov)
+    partial[control_idx, :] = np.nan
+    partial[:, control_idx] = np.nan
+    return partial
+
+def calculate_all_correlations(benchmark=BENCHMARK, controls=PARTIAL_CONTROLS):
     print("Loading price data...")
     prices = pd.read_parquet('market_prices_stooq.parquet')
-    
+
     # Calculate returns
     returns = prices.pct_change()
-    
-    # Get all unique pairs
+
+    # Get all unique pairs, in the same order as itertools.combinations
     assets = prices.columns
-    pairs = list(combinations(assets, 2))
-    print(f"Calculating correlations for {len(pairs)} pairs...")
-    
-    # Define lookback periods
-    lookbacks = {
-        '1M': 21,
-        '3M': 63,
-        '6M': 126,
-        '12M': 252
-    }
-    
-    # Calculate correlations for each pair
-    results = []
-    for i, (asset1, asset2) in enumerate(pairs, 1):
-        if i % 100 == 0:  # Progress update every 100 pairs
-            print(f"Processing pair {i} of {len(pairs)}")
-            
-        row = {
-            'Asset1': asset1,
-            'Asset2': asset2
-        }
-        
-        # Calculate correlation for each lookback period
-        for period, days in lookbacks.items():
-            corr = returns[asset1].rolling(days).corr(returns[asset2]).iloc[-1]
-            row[f'Corr_{period}'] = round(corr, 3)
-        
-        results.append(row)
-    
-    # Convert to DataFrame
-    corr_df = pd.DataFrame(results)
-    
+    asset_idx = np.arange(len(assets))
+    idx1, idx2 = np.triu_indices(len(assets), k=1)
+    print(f"Calculating correlations for {len(idx1)} pairs...")
+
+    benchmark_idx = assets.get_loc(benchmark)
+    control_idx = [assets.get_loc(control) for control in controls]
+
+    # Every statistic below comes from the same accumulated moments
+    moments = accumulate_window_moments(returns, LOOKBACKS)
+
+    corr_df = pd.DataFrame({
+        'Asset1': assets[idx1],
+        'Asset2': assets[idx2]
+    })
+    beta_df = pd.DataFrame({
+        'Asset': assets,
+        'Benchmark': benchmark
+    })
+    covariance_matrices = {}
+
+    for period, (count, sums, cross_products, complete) in moments.items():
+        cov = moments_to_covariance(count, sums, cross_products, complete)
+        corr = covariance_to_correlation(cov)
+        partial = partial_correlation(cov, control_idx)
+
+        corr_df[f'Corr_{period}'] = np.round(corr[idx1, idx2], 3)
+        corr_df[f'Cov_{period}'] = cov[idx1, idx2]
+        corr_df[f'PartialCorr_{period}'] = np.round(partial[idx1, idx2], 3)
+
+        beta_df[f'Beta_{period}'] = np.round(cov[asset_idx, benchmark_idx] / cov[benchmark_idx, benchmark_idx], 3)
+        covariance_matrices[period] = pd.DataFrame(cov, index=assets, columns=assets)
+
+    covariance_df = pd.concat(covariance_matrices, names=['Lookback', 'Asset'])
+
     # Save to parquet
     corr_df.to_parquet('correlation_matrix.parquet', compression='snappy')
-    
+    covariance_df.to_parquet('covariance_matrix.parquet', compression='snappy')
+    beta_df.to_parquet('beta.parquet', compression='snappy')
+
     print("\nCorrelation Summary:")
-    for period in lookbacks.keys():
+    for period in LOOKBACKS.keys():
         col = f'Corr_{period}'
         print(f"\n{period} Statistics:")
         print(f"Average correlation: {corr_df[col].mean():.3f}")
         print(f"Highest correlation: {corr_df[col].max():.3f}")
         print(f"Lowest correlation: {corr_df[col].min():.3f}")
-    
+        print(f"Average partial correlation (net of {', '.join(controls)}): {corr_df[f'PartialCorr_{period}'].mean():.3f}")
+
     # Show some interesting pairs
     print("\nMost Correlated Pairs (1M):")
     print(corr_df.nlargest(5, 'Corr_1M')[['Asset1', 'Asset2', 'Corr_1M']])
-    
+
     print("\nLeast Correlated Pairs (1M):")
     print(corr_df.nsmallest(5, 'Corr_1M')[['Asset1', 'Asset2', 'Corr_1M']])
-    
+
+    print(f"\nHighest Beta to {benchmark} (12M):")
+    print(beta_df.nlargest(5, 'Beta_12M')[['Asset', 'Beta_12M']])
+
     return corr_df
 
 if __name__ == "__main__":
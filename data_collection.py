@@ -5,6 +5,8 @@ import time
 from multiprocessing import Pool, cpu_count
 import warnings
 
+from startup_snapshot import build_startup_snapshot
+
 # Suppress warnings for cleaner output
 warnings.filterwarnings('ignore')
 
@@ -79,6 +81,8 @@ def main():
         
         df.to_parquet('market_prices_stooq.parquet', compression='snappy')
         print("Data saved to 'market_prices_stooq.parquet'")
+        
+        build_startup_snapshot()
         return df
     else:
         raise ValueError("No valid data retrieved")
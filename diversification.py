@@ -0,0 +1,137 @@
+import numpy as np
+import pandas as pd
+
+from calculate_correlations import LOOKBACKS
+
+TRADING_DAYS_PER_YEAR = 252
+
+def load_covariance_matrices(cov_path='covariance_matrix.parquet'):
+    """
+    Load the per-lookback covariance matrices written by calculate_correlations.py.
+    Returns {lookback: DataFrame} with assets on both axes.
+    """
+    covariance_df = pd.read_parquet(cov_path)
+    return {
+        period: covariance_df.xs(period, level='Lookback')
+        for period in LOOKBACKS
+        if period in covariance_df.index.get_level_values('Lookback')
+    }
+
+def normalize_weights(holdings, assets):
+    """
+    Turn holdings (a list of tickers for equal weights, or a {ticker: weight} dict) into
+    asset positions and weights that sum to one.
+    """
+    if not isinstance(holdings, dict):
+        holdings = {ticker: 1.0 for ticker in holdings}
+
+    unknown = [ticker for ticker in holdings if ticker not in assets]
+    if unknown:
+        raise ValueError(f"Unknown tickers in basket: {', '.join(unknown)}")
+
+    weights = np.array(list(holdings.values()), dtype=float)
+    if len(weights) == 0 or (weights < 0).any() or weights.sum() <= 0:
+        raise ValueError("Basket weights must be non-negative and sum to a positive value")
+
+    return assets.get_indexer(list(holdings)), weights / weights.sum()
+
+def basket_statistics(cov_df: pd.DataFrame, holdings):
+    """
+    Weighted average pairwise correlation, diversification ratio and annualized volatility
+    of a basket. The diversification ratio is the weighted average asset volatility divided
+    by the portfolio volatility.
+    """
+    idx, weights = normalize_weights(holdings, cov_df.index)
+    cov = cov_df.to_numpy()[np.ix_(idx, idx)]
+    std = np.sqrt(np.diag(cov))
+
+    variance = weights @ cov @ weights
+    with np.errstate(divide='ignore', invalid='ignore'):
+        corr = cov / np.outer(std, std)
+        pair_weights = np.outer(weights, weights)
+        np.fill_diagonal(pair_weights, 0.0)
+        avg_corr = (pair_weights * corr).sum() / pair_weights.sum()
+        diversification_ratio = (weights @ std) / np.sqrt(variance)
+
+    return {
+        'AvgPairwiseCorr': avg_corr,
+        'DiversificationRatio': diversification_ratio,
+        'Volatility': np.sqrt(variance * TRADING_DAYS_PER_YEAR)
+    }
+
+def basket_report(covariance_matrices: dict, holdings):
+    """
+    Basket statistics for every lookback, one row per lookback.
+    """
+    return pd.DataFrame(
+        {period: basket_statistics(cov_df, holdings) for period, cov_df in covariance_matrices.items()}
+    ).T.rename_axis('Lookback')
+
+def rank_diversifiers(cov_df: pd.DataFrame, holdings, by='correlation', candidate_weight=0.1, top_n=10):
+    """
+    Rank assets outside the basket by how much adding them at candidate_weight (scaling the
+    held weights down to make room) lowers the basket's average pairwise correlation
+    (by='correlation') or volatility (by='variance').
+
+    Only the covariance columns of the held assets are touched, so a query costs
+    O(assets x holdings) however large the universe is.
+    """
+    if by not in ('correlation', 'variance'):
+        raise ValueError("by must be 'correlation' or 'variance'")
+    if not 0 < candidate_weight < 1:
+        raise ValueError("candidate_weight must be between 0 and 1")
+
+    assets = cov_df.index
+    idx, weights = normalize_weights(holdings, assets)
+    cov = cov_df.to_numpy()
+    std = np.sqrt(np.diag(cov))
+    a = candidate_weight
+    b = 1.0 - a
+
+    # Current basket moments
+    held_cov = cov[np.ix_(idx, idx)]
+    held_std = std[idx]
+    variance = weights @ held_cov @ weights
+    pair_weights = np.outer(weights, weights)
+    np.fill_diagonal(pair_weights, 0.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        corr_sum = (pair_weights * held_cov / np.outer(held_std, held_std)).sum()
+    pair_weight_sum = pair_weights.sum()
+
+    # Each candidate's covariance and weighted correlation with the basket
+    cov_to_basket = cov[:, idx] @ weights
+    with np.errstate(divide='ignore', invalid='ignore'):
+        weighted_corr = (cov[:, idx] / np.outer(std, held_std)) @ weights
+
+        new_variance = b * b * variance + 2 * a * b * cov_to_basket + a * a * std ** 2
+        new_avg_corr = (b * b * corr_sum + 2 * a * b * weighted_corr) / (b * b * pair_weight_sum + 2 * a * b)
+        new_ratio = (b * (weights @ held_std) + a * std) / np.sqrt(new_variance)
+        corr_to_basket = cov_to_basket / (std * np.sqrt(variance))
+
+    results = pd.DataFrame({
+        'Asset': assets,
+        'CorrToBasket': corr_to_basket,
+        'AvgPairwiseCorr': new_avg_corr,
+        'DiversificationRatio': new_ratio,
+        'Volatility': np.sqrt(new_variance * TRADING_DAYS_PER_YEAR)
+    })
+    candidates = np.ones(len(assets), dtype=bool)
+    candidates[idx] = False
+    results = results[candidates].dropna()
+
+    sort_column = 'AvgPairwiseCorr' if by == 'correlation' else 'Volatility'
+    return results.nsmallest(top_n, sort_column).reset_index(drop=True)
+
+if __name__ == "__main__":
+    try:
+        covariance_matrices = load_covariance_matrices()
+        basket = {'SPY': 0.6, 'QQQ': 0.2, 'TLT': 0.2}
+
+        print(f"Basket: {basket}")
+        print("\nBasket Statistics:")
+        print(basket_report(covariance_matrices, basket).round(3))
+
+        print("\nTop Diversifiers (12M, by correlation):")
+        print(rank_diversifiers(covariance_matrices['12M'], basket).round(3))
+    except Exception as e:
+        print(f"An error occurred: {e}")
@@ -0,0 +1,111 @@
+import hashlib
+import json
+import os
+
+PRICES_PATH = 'market_prices_stooq.parquet'
+SNAPSHOT_PATH = 'startup_snapshot.json'
+
+ASSET_DESCRIPTIONS = {
+    'SPY': 'S&P 500 ETF',
+    'QQQ': 'Nasdaq 100 ETF',
+    'IWM': 'Russell 2000 ETF',
+    'IJR': 'S&P Small-Cap ETF',
+    'IJH': 'S&P Mid-Cap ETF',
+    'IWF': 'Russell 1000 Growth ETF',
+    'IWD': 'Russell 1000 Value ETF',
+    'EFA': 'Developed Markets ETF',
+    'EWJ': 'Japan ETF',
+    'FXI': 'China ETF',
+    'EWG': 'Germany ETF',
+    'EEM': 'Emerging Markets ETF',
+    'EWZ': 'Brazil ETF',
+    'INDA': 'India ETF',
+    'EWT': 'Taiwan ETF',
+    'EWY': 'South Korea ETF',
+    'EWW': 'Mexico ETF',
+    'TLT': '20+ Year Treasury ETF',
+    'IEF': '7-10 Year Treasury ETF',
+    'LQD': 'Investment Grade Bond ETF',
+    'HYG': 'High Yield Bond ETF',
+    'BND': 'Total Bond Market ETF',
+    'TIP': 'TIPS Bond ETF',
+    'UUP': 'US Dollar ETF',
+    'FXE': 'Euro ETF',
+    'XLF': 'Financial Select Sector SPDR Fund',
+    'XLK': 'Technology Select Sector SPDR Fund',
+    'XLE': 'Energy Select Sector SPDR Fund',
+    'XLV': 'Health Care Select Sector SPDR Fund',
+    'XLI': 'Industrial Select Sector SPDR Fund',
+    'XLP': 'Consumer Staples Select Sector SPDR Fund',
+    'XLY': 'Consumer Discretionary Select Sector SPDR Fund',
+    'XLB': 'Materials Select Sector SPDR Fund',
+    'XLC': 'Communication Services Select Sector SPDR Fund',
+    'XLU': 'Utilities Select Sector SPDR Fund',
+    'VNQ': 'Real Estate ETF',
+    'GLD': 'Gold ETF',
+    'SLV': 'Silver ETF',
+    'USO': 'Oil ETF',
+    'UNG': 'Natural Gas ETF',
+    'DBC': 'Commodity Index ETF',
+    'BTC': 'Bitcoin'
+}
+
+def file_fingerprint(path):
+    """
+    SHA-256 of a file's contents, used to detect a snapshot that no longer matches its source.
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def snapshot_from_prices(prices):
+    """
+    Build the startup metadata (asset list, descriptions, date bounds) from a prices frame.
+    """
+    assets = sorted(prices.columns.unique())
+    return {
+        'assets': assets,
+        'descriptions': {asset: ASSET_DESCRIPTIONS.get(asset, 'Unknown Asset') for asset in assets},
+        'start_date': prices.index.min().strftime('%Y-%m-%d'),
+        'end_date': prices.index.max().strftime('%Y-%m-%d')
+    }
+
+def build_startup_snapshot(prices_path=PRICES_PATH, snapshot_path=SNAPSHOT_PATH):
+    import pandas as pd
+
+    print("Building startup snapshot...")
+    prices = pd.read_parquet(prices_path)
+    if not isinstance(prices.index, pd.DatetimeIndex):
+        prices.index = pd.to_datetime(prices.index)
+
+    snapshot = snapshot_from_prices(prices)
+    snapshot['prices_sha256'] = file_fingerprint(prices_path)
+
+    with open(snapshot_path, 'w') as f:
+        json.dump(snapshot, f, indent=2)
+
+    print(f"Wrote {snapshot_path}: {len(snapshot['assets'])} assets, "
+          f"{snapshot['start_date']} to {snapshot['end_date']}")
+    return snapshot
+
+def load_startup_snapshot(snapshot_path=SNAPSHOT_PATH, prices_path=PRICES_PATH):
+    """
+    Load the startup snapshot without importing pandas.
+    Returns None if the snapshot is missing, unreadable or out of date with the prices file.
+    """
+    try:
+        with open(snapshot_path) as f:
+            snapshot = json.load(f)
+        if os.path.exists(prices_path) and snapshot.get('prices_sha256') != file_fingerprint(prices_path):
+            return None
+        return snapshot
+    except (OSError, ValueError):
+        return None
+
+if __name__ == "__main__":
+    try:
+        startup_snapshot = build_startup_snapshot()
+    except Exception as e:
+        print(f"An error occurred: {e}")